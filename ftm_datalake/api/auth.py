@@ -17,9 +17,9 @@ from pydantic import BaseModel
 
 from ftm_datalake.api.util import DEFAULT_ERROR, Context, ensure_path_context
 from ftm_datalake.logging import get_logger
-from ftm_datalake.settings import ApiSettings
+from ftm_datalake.settings import get_api_settings
 
-settings = ApiSettings()
+settings = get_api_settings()
 log = get_logger(__name__)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/", auto_error=False)
 
@@ -7,12 +7,12 @@ from ftm_datalake.api.auth import Token, create_access_token, ensure_auth_contex
 from ftm_datalake.api.util import Context, Errors, ensure_path_context, stream_file
 from ftm_datalake.archive import get_archive
 from ftm_datalake.logging import get_logger
-from ftm_datalake.settings import ApiSettings, Settings
+from ftm_datalake.settings import get_api_settings, get_settings
 
 log = get_logger(__name__)
 
-settings = Settings()
-api_settings = ApiSettings()
+settings = get_settings()
+api_settings = get_api_settings()
 
 app = FastAPI(
     debug=settings.debug,
@@ -8,9 +8,9 @@ from ftm_datalake import __version__
 from ftm_datalake.archive import archive
 from ftm_datalake.logging import get_logger
 from ftm_datalake.model import File
-from ftm_datalake.settings import Settings
+from ftm_datalake.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 log = get_logger(__name__)
 DEFAULT_ERROR = HTTPException(404)
 BASE_HEADER = {"x-ftm-datalake-version": __version__}
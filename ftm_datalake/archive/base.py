@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Generator
@@ -73,11 +74,13 @@ class Archive(BaseArchive):
                 yield self.get_dataset(dataset)
 
     def make_catalog(self, collect_stats: bool | None = False) -> Catalog:
-        datasets = []
-        for dataset in self.get_datasets():
-            ds = Dataset(
+        def _collect(dataset: "DatasetArchive") -> Dataset:
+            return Dataset(
                 name=dataset.name,
                 from_uri=dataset.make_index(collect_stats=collect_stats),
             )
-            datasets.append(ds)
+
+        # indexing each dataset is independent, i/o bound work
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            datasets = list(executor.map(_collect, self.get_datasets()))
         return Catalog(**self.model_dump(), datasets=datasets)
@@ -19,13 +19,21 @@ from ftmq.types import CEGenerator
 from ftm_datalake.archive.cache import get_cache
 from ftm_datalake.logging import get_logger
 from ftm_datalake.model import Docs, Document
-from ftm_datalake.settings import ArchiveSettings
+from ftm_datalake.settings import get_archive_settings
 
 if TYPE_CHECKING:
     from ftm_datalake.archive import DatasetArchive
 
 log = get_logger(__name__)
-settings = ArchiveSettings()
+settings = get_archive_settings()
+
+
+class _RowSink(list):
+    """Collect one entry per csv row: the csv module calls write() exactly
+    once per row, which keeps row boundaries intact even for field values
+    containing newlines"""
+
+    write = list.append
 
 
 class Documents:
@@ -110,8 +118,7 @@ class Documents:
                 new.to_csv(f, index=False)
             # documents.csv.{timestamp}.diff
             with self.open("w", f"{now}.diff") as f:
-                for line in diff:
-                    f.write(line + "\n")
+                f.writelines(line + "\n" for line in diff)
         # documents.csv
         with self.open("w") as f:
             new.to_csv(f, index=False)
@@ -127,13 +134,12 @@ class Documents:
         return int(df["size"].sum())
 
     def make_lines(self, df: pd.DataFrame) -> list[str]:
-        lines: set[str] = set()
-        for _, row in df.iterrows():
-            io = StringIO()
-            writer = csv.DictWriter(io, self.HEADER)
-            writer.writerow(dict(row))
-            lines.add(io.getvalue().strip())
-        return list(sorted(lines))
+        # write all rows through one csv writer instead of allocating a
+        # StringIO + writer per row
+        rows = _RowSink()
+        writer = csv.DictWriter(rows, self.HEADER)
+        writer.writerows(df.to_dict("records"))
+        return list(sorted({row.rstrip("\r\n") for row in rows}))
 
     def open(
         self, mode: Literal["r", "w"] | None = "r", suffix: str | None = None
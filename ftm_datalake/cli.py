@@ -1,33 +1,24 @@
+import shutil
 from typing import Annotated, Any, Optional, TypedDict
 
-import orjson
 import typer
 from anystore.io import DEFAULT_WRITE_MODE, smart_open, smart_write
-from anystore.util import clean_dict
 from pydantic import BaseModel
 from rich.console import Console
 
 from ftm_datalake import __version__
 from ftm_datalake.archive import configure_archive, get_dataset
 from ftm_datalake.archive.dataset import DatasetArchive
-from ftm_datalake.crawl import crawl
 from ftm_datalake.exceptions import ImproperlyConfigured
-from ftm_datalake.export import export_dataset
 from ftm_datalake.logging import configure_logging
-from ftm_datalake.make import make_dataset
 from ftm_datalake.model import DatasetModel
-from ftm_datalake.settings import ArchiveSettings, Settings
-from ftm_datalake.sync.aleph import sync_to_aleph
-from ftm_datalake.sync.aleph_entities import load_catalog, load_dataset
-from ftm_datalake.sync.memorious import (
-    get_file_name,
-    get_file_name_strip_func,
-    get_file_name_templ_func,
-    import_memorious,
-)
-
-settings = Settings()
-archive_settings = ArchiveSettings()
+from ftm_datalake.settings import get_archive_settings, get_settings
+
+# heavy submodules (aleph client, sync workers, ...) are imported lazily
+# within their command functions to keep CLI startup fast
+
+settings = get_settings()
+archive_settings = get_archive_settings()
 cli = typer.Typer(no_args_is_help=True, pretty_exceptions_enable=settings.debug)
 memorious = typer.Typer(no_args_is_help=True, pretty_exceptions_enable=settings.debug)
 aleph = typer.Typer(no_args_is_help=True, pretty_exceptions_enable=settings.debug)
@@ -42,15 +33,23 @@ class State(TypedDict):
 
 STATE: State = {"dataset": None}
 
+LS_BATCH_SIZE = 1000
+LS_KEYS_BATCH_SIZE = 100_000
+DIFF_CHUNK_SIZE = 1 << 18  # 256 KiB
+
+
+def _to_json_bytes(obj: BaseModel) -> bytes:
+    # serialize straight from pydantic's rust core, skipping the
+    # intermediate `model_dump()` dict
+    return obj.__pydantic_serializer__.to_json(obj) + b"\n"
+
 
 def write_obj(obj: BaseModel | None, out: str) -> None:
     if out == "-":
         console.print(obj)
     else:
         if obj is not None:
-            smart_write(
-                out, orjson.dumps(obj.model_dump(), option=orjson.OPT_APPEND_NEWLINE)
-            )
+            smart_write(out, _to_json_bytes(obj))
 
 
 class ErrorHandler:
@@ -123,15 +122,17 @@ def cli_catalog(
     with ErrorHandler():
         archive = configure_archive()
         if names_only:
-            datasets = set()
-            for dataset in archive.get_datasets():
-                datasets.add(dataset.name)
-            data = "\n".join(sorted(datasets))
-            smart_write(out_uri, data.encode() + b"\n")
+            names = sorted({d.name for d in archive.get_datasets()})
+            with smart_open(out_uri, "wb") as o:
+                for i in range(0, len(names), LS_KEYS_BATCH_SIZE):
+                    batch = names[i : i + LS_KEYS_BATCH_SIZE]
+                    o.write(("\n".join(batch) + "\n").encode())
         else:
             catalog = archive.make_catalog(collect_stats=collect_stats)
-            data = clean_dict(catalog.model_dump(mode="json"))
-            smart_write(out_uri, orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+            data = catalog.__pydantic_serializer__.to_json(
+                catalog, exclude_none=True, exclude_defaults=True
+            )
+            smart_write(out_uri, data + b"\n")
 
 
 @cli.command("versions")
@@ -153,7 +154,9 @@ def cli_diff(
     with Dataset() as dataset:
         ver = dataset.documents.get_version(version)
         with smart_open(out_uri, DEFAULT_WRITE_MODE) as out:
-            out.write(ver)
+            # chunked write to avoid one huge buffer hitting the target
+            for i in range(0, len(ver), DIFF_CHUNK_SIZE):
+                out.write(ver[i : i + DIFF_CHUNK_SIZE])
 
 
 @cli.command("make")
@@ -175,6 +178,8 @@ def cli_make(
     """
     Make or update a ftm_datalake dataset and check integrity
     """
+    from ftm_datalake.make import make_dataset
+
     with Dataset() as dataset:
         if dataset_metadata_only:
             dataset.make_index()
@@ -192,7 +197,7 @@ def cli_get(key: str, out_uri: Annotated[str, typer.Option("-o")] = "-"):
     with Dataset() as dataset:
         file = dataset.lookup_file(key)
         with dataset.open_file(file) as i, smart_open(out_uri, "wb") as o:
-            o.write(i.read())
+            shutil.copyfileobj(i, o, length=1024 * 1024)
 
 
 @cli.command("head")
@@ -201,13 +206,7 @@ def cli_head(key: str, out_uri: Annotated[str, typer.Option("-o")] = "-"):
     Retrieve a file info from dataset archive and write to out uri (default: stdout)
     """
     with Dataset() as dataset:
-        smart_write(
-            out_uri,
-            orjson.dumps(
-                dataset.lookup_file(key).model_dump(),
-                option=orjson.OPT_APPEND_NEWLINE,
-            ),
-        )
+        smart_write(out_uri, _to_json_bytes(dataset.lookup_file(key)))
 
 
 @cli.command("ls")
@@ -220,17 +219,26 @@ def cli_ls(
     List all files in dataset archive
     """
     with Dataset() as dataset:
-        if keys:
-            files = (f.key.encode() + b"\n" for f in dataset.iter_files())
-        elif checksums:
-            files = (f.content_hash.encode() + b"\n" for f in dataset.iter_files())
-        else:
-            files = (
-                orjson.dumps(f.model_dump(), option=orjson.OPT_APPEND_NEWLINE)
-                for f in dataset.iter_files()
-            )
         with smart_open(out_uri, "wb") as o:
-            o.writelines(files)
+            if keys or checksums:
+                attr = "key" if keys else "content_hash"
+                lines: list[str] = []
+                for f in dataset.iter_files():
+                    lines.append(getattr(f, attr))
+                    if len(lines) >= LS_KEYS_BATCH_SIZE:
+                        o.write(("\n".join(lines) + "\n").encode())
+                        lines.clear()
+                if lines:
+                    o.write(("\n".join(lines) + "\n").encode())
+            else:
+                batch: list[bytes] = []
+                for f in dataset.iter_files():
+                    batch.append(_to_json_bytes(f))
+                    if len(batch) >= LS_BATCH_SIZE:
+                        o.write(b"".join(batch))
+                        batch.clear()
+                if batch:
+                    o.write(b"".join(batch))
 
 
 @cli.command("crawl")
@@ -267,6 +275,8 @@ def cli_crawl(
     """
     Crawl documents from local or remote sources
     """
+    from ftm_datalake.crawl import crawl
+
     with Dataset() as dataset:
         write_obj(
             crawl(
@@ -288,6 +298,8 @@ def cli_export(out: str):
     """
     Export a complete dataset in LeakRFC format
     """
+    from ftm_datalake.export import export_dataset
+
     with Dataset() as dataset:
         write_obj(export_dataset(dataset, out), "-")
 
@@ -308,6 +320,13 @@ def cli_sync_memorious(
     """
     Sync a memorious data store into a ftm_datalake dataset
     """
+    from ftm_datalake.sync.memorious import (
+        get_file_name,
+        get_file_name_strip_func,
+        get_file_name_templ_func,
+        import_memorious,
+    )
+
     with Dataset() as dataset:
         if name_only:
             key_func = get_file_name
@@ -336,6 +355,8 @@ def cli_aleph_sync(
     """
     Sync a ftm_datalake dataset to Aleph
     """
+    from ftm_datalake.sync.aleph import sync_to_aleph
+
     with Dataset() as dataset:
         res = sync_to_aleph(
             dataset=dataset,
@@ -363,6 +384,8 @@ def cli_aleph_load_dataset(
     """
     Load entities into an Aleph instance
     """
+    from ftm_datalake.sync.aleph_entities import load_dataset
+
     with ErrorHandler():
         res = load_dataset(
             uri,
@@ -394,6 +417,8 @@ def cli_aleph_load_catalog(
     """
     Load entities into an Aleph instance
     """
+    from ftm_datalake.sync.aleph_entities import load_catalog
+
     with ErrorHandler():
         for res in load_catalog(
             uri,
@@ -21,9 +21,9 @@ from structlog.stdlib import (
 )
 from structlog.stdlib import get_logger as get_raw_logger
 
-from ftm_datalake.settings import Settings
+from ftm_datalake.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 
 def get_logger(name: str, *args, **kwargs) -> BoundLogger:
@@ -1,8 +1,9 @@
+from functools import lru_cache
 from typing import Optional
 
 from anystore.io import DoesNotExist, smart_read
 from anystore.model import StoreModel
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from ftm_datalake.model import ArchiveModel
@@ -59,7 +60,22 @@ class ApiSettings(BaseSettings):
     access_token_algorithm: str = "HS256"
 
     title: str = "LeakRFC Api"
-    description: str = get_api_doc()
+    description: str = Field(default_factory=get_api_doc)
     contact: ApiContactSettings | None = None
 
     allowed_origin: Optional[HttpUrl] = "http://localhost:3000"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+@lru_cache(maxsize=1)
+def get_archive_settings() -> ArchiveSettings:
+    return ArchiveSettings()
+
+
+@lru_cache(maxsize=1)
+def get_api_settings() -> ApiSettings:
+    return ApiSettings()
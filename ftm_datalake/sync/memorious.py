@@ -1,9 +1,12 @@
 from datetime import datetime
+from functools import lru_cache
+from multiprocessing import cpu_count
 from pathlib import Path
 from typing import Any, Callable
 from urllib.parse import unquote, urlparse
 
 from anystore import anycache
+from anystore.settings import Settings as AnystoreSettings
 from anystore.store import get_store
 from anystore.types import StrGenerator, Uri
 from anystore.util import make_data_checksum
@@ -20,10 +23,7 @@ log = get_logger(__name__)
 
 
 def get_cache_key(self: "MemoriousWorker", key: str) -> str | None:
-    host = urlparse(self.memorious.uri).netloc
-    if host is None:
-        host = make_data_checksum(str(self.memorious.uri))
-    return make_cache_key(self, "sync", "memorious", host, key)
+    return make_cache_key(self, "sync", "memorious", self._cache_host, key)
 
 
 class MemoriousStatus(WorkerStatus):
@@ -32,14 +32,33 @@ class MemoriousStatus(WorkerStatus):
     not_found: int = 0
 
 
+REMOTE_THREADS = 16
+
+
 class MemoriousWorker(DatasetWorker):
     def __init__(
         self, uri: Uri, key_func: Callable | None = None, *args, **kwargs
     ) -> None:
+        memorious = get_store(uri, serialization_mode="raw")
+        if not memorious.is_local:
+            # each task does two round-trips (metadata get + file info), so
+            # for remote stores use more consumers to hide the latency - but
+            # only when `ANYSTORE_WORKER_THREADS` is not tuned explicitly
+            configured = AnystoreSettings().worker_threads
+            if configured == cpu_count():
+                kwargs.setdefault("threads", max(REMOTE_THREADS, configured))
         super().__init__(*args, **kwargs)
-        self.memorious = get_store(uri, serialization_mode="raw")
+        self.memorious = memorious
         self.key_func = key_func or get_file_key
         self.status_model = MemoriousStatus
+        # the cache key host is constant per worker, compute it only once
+        # (str.partition is much cheaper than urlparse for this narrow need)
+        uri = str(self.memorious.uri)
+        _, sep, rest = uri.partition("://")
+        host = rest.partition("/")[0] if sep else ""
+        self._cache_host = host or make_data_checksum(uri)
+        # known keys up front to avoid one storage round-trip per task
+        self._existing_keys: set[str] = set(self.dataset.documents.get_db()["key"])
 
     def get_tasks(self) -> StrGenerator:
         yield from self.memorious.iterate_keys(glob="*.json")
@@ -49,16 +68,10 @@ class MemoriousWorker(DatasetWorker):
         now = datetime.now()
         file = self.load_memorious(task)
         if file is not None:
-            if not self.dataset.exists(file.key):
-                uri = self.memorious.get_key(file.extra.pop("_file_name"))
-                self.dataset.archive_file(file, from_uri=uri)
-                self.count(added=1)
-            else:
-                self.log_info(
-                    f"Skipping already existing `{file.key}` ...",
-                    store=self.memorious.uri,
-                )
-                self.count(skipped=1)
+            uri = self.memorious.get_key(file.extra.pop("_file_name"))
+            self.dataset.archive_file(file, from_uri=uri)
+            self._existing_keys.add(file.key)
+            self.count(added=1)
         return now
 
     def load_memorious(self, key: str) -> File | None:
@@ -72,10 +85,20 @@ class MemoriousWorker(DatasetWorker):
             self.count(not_found=1)
         else:
             key = self.key_func(data)
+            file_key = key.strip("/")
+            if file_key in self._existing_keys:
+                # short-circuit before fetching the file info, which would be
+                # another store round-trip for an already archived file
+                self.log_info(
+                    f"Skipping already existing `{file_key}` ...",
+                    store=self.memorious.uri,
+                )
+                self.count(skipped=1)
+                return None
             info = self.memorious.info(data["_file_name"])
             return File(
-                key=key.strip("/"),
-                name=Path(key).name,
+                key=file_key,
+                name=file_key.rsplit("/", 1)[-1],
                 size=info.size,
                 content_hash=content_hash,
                 store=str(self.memorious.uri),
@@ -122,12 +145,24 @@ def import_memorious(
     return worker.run()
 
 
+@lru_cache(maxsize=8192)
+def _url_path(url: str) -> str:
+    return urlparse(url).path
+
+
+@lru_cache(maxsize=8192)
+def _parse_url_path(url: str) -> str:
+    return unquote(_url_path(url))
+
+
 def get_file_key(data: dict[str, Any]) -> str:
-    return unquote(urlparse(data["url"]).path).strip("/")
+    return _parse_url_path(data["url"]).strip("/")
 
 
 def get_file_name(data: dict[str, Any]) -> str:
-    return unquote(Path(urlparse(data["url"]).path).name)
+    # take the name from the still-quoted path: an encoded slash (%2F)
+    # belongs to the name, it must not become a path separator
+    return unquote(Path(_url_path(data["url"])).name)
 
 
 def get_file_name_templ_func(tmpl: str) -> Callable:
@@ -139,11 +174,12 @@ def get_file_name_templ_func(tmpl: str) -> Callable:
 
 def get_file_name_strip_func(strip_prefix: str) -> Callable:
     strip_prefix = strip_prefix.strip("/")
+    plen = len(strip_prefix)
 
     def _func(data: dict[str, Any]) -> str:
-        key = get_file_key(data)
-        if key.startswith(strip_prefix):
-            key = key[len(strip_prefix) :].strip("/")
+        key = _parse_url_path(data["url"]).strip("/")
+        if key[:plen] == strip_prefix:
+            key = key[plen:].lstrip("/")
         return key
 
     return _func
@@ -7,7 +7,7 @@ from anystore.worker import Worker
 
 from ftm_datalake.logging import get_logger
 from ftm_datalake.model import File
-from ftm_datalake.settings import ArchiveSettings, Settings
+from ftm_datalake.settings import get_archive_settings, get_settings
 
 if TYPE_CHECKING:
     from ftm_datalake.archive.dataset import DatasetArchive
@@ -15,48 +15,38 @@ if TYPE_CHECKING:
 
 log = get_logger(__name__)
 
-settings = Settings()
-ftm_datalake_settings = ArchiveSettings()
+settings = get_settings()
+ftm_datalake_settings = get_archive_settings()
 
 
 def make_cache_key(worker: "DatasetWorker", action: str, *extra: str) -> str | None:
-    return (
-        f"{ftm_datalake_settings.cache_prefix}/"
-        f"{worker.dataset.name}/{action}/{'/'.join(extra)}"
-    )
+    return worker._cache_prefix_head + action + "/" + "/".join(extra)
 
 
 class DatasetWorker(Worker):
     def __init__(self, dataset: "DatasetArchive", *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.dataset = dataset
+        # constant head of the per-task cache keys, computed only once
+        self._cache_prefix_head = (
+            f"{ftm_datalake_settings.cache_prefix}/{dataset.name}/"
+        )
+        self._log_ctx = {
+            "dataset": self.dataset.name,
+            "storage": self.dataset._storage.uri,
+        }
 
     def get_tasks(self) -> Any:
         yield from self.dataset.iter_files()
 
     def log_info(self, msg: str, **ctx) -> None:
-        ctx = {
-            "dataset": self.dataset.name,
-            "storage": self.dataset._storage.uri,
-            **ctx,
-        }
-        log.info(msg, **ctx)
+        log.info(msg, **{**self._log_ctx, **ctx})
 
     def log_warning(self, msg: str, **ctx) -> None:
-        ctx = {
-            "dataset": self.dataset.name,
-            "storage": self.dataset._storage.uri,
-            **ctx,
-        }
-        log.warning(msg, **ctx)
+        log.warning(msg, **{**self._log_ctx, **ctx})
 
     def log_error(self, msg: str, **ctx) -> None:
-        ctx = {
-            "dataset": self.dataset.name,
-            "storage": self.dataset._storage.uri,
-            **ctx,
-        }
-        log.error(msg, **ctx)
+        log.error(msg, **{**self._log_ctx, **ctx})
 
     def exception(self, task: Any, e: Exception) -> None:
         self.log_error(
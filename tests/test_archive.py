@@ -1,3 +1,4 @@
+import pandas as pd
 from moto import mock_aws
 from rigour.mime.types import PLAIN
 
@@ -63,6 +64,31 @@ def test_archive_dataset(test_dataset):
 #     assert isinstance(dataset, ReadOnlyDatasetArchive)
 
 
+def test_archive_documents_make_lines(tmp_path):
+    dataset = get_dataset("lines_dataset", uri=tmp_path)
+    row = {
+        "content_hash": "h1",
+        "size": 1,
+        "mimetype": "application/pdf",
+        "created_at": "t1",
+        "updated_at": "t1",
+    }
+    df = pd.DataFrame(
+        [
+            # keys are unquoted url paths, so they may contain newlines
+            # (%0A) or quotes - row boundaries must survive both
+            {"key": "newline\nin-key.pdf", **row},
+            {"key": 'quoted "key", with comma.pdf', **row},
+            {"key": "plain.pdf", **row},
+        ]
+    )
+    lines = dataset.documents.make_lines(df)
+    assert len(lines) == 3
+    assert '"newline\nin-key.pdf",h1,1,application/pdf,t1,t1' in lines
+    assert '"quoted ""key"", with comma.pdf",h1,1,application/pdf,t1,t1' in lines
+    assert "plain.pdf,h1,1,application/pdf,t1,t1" in lines
+
+
 def test_archive_zip_dataset(fixtures_path):
     dataset = get_dataset(
         "test_dataset", uri=fixtures_path / "test_dataset.ftm_datalake"